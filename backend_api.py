@@ -1,15 +1,18 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import PyPDF2
+import codecs
+import hashlib
 import io
 import nltk
+from collections import OrderedDict
 import numpy as np
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.cluster.util import cosine_distance
+from nltk.tokenize import sent_tokenize
+from scipy.sparse import csr_matrix
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
 from transformers import pipeline
-import ssl
 import re
 from video_summarizer_api import summarize_video_with_timestamps
 from backend_validation import (
@@ -19,72 +22,167 @@ from backend_validation import (
     validate_summarization_method,
     validate_max_sentences,
     validate_request_body,
-    check_rate_limit
+    check_rate_limit,
+    MAX_TEXT_LENGTH
 )
 from grammar_corrector import polish_summary
 from smart_formatter import format_smart_summary
 from resume_preprocessor import preprocess_resume
 
-# Fix SSL certificate issues
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+# Download necessary NLTK resources only when missing; unconditional
+# downloads add network round-trips to every process start.
+# Pre-bundle in containers with:
+#   python -m nltk.downloader -d /usr/share/nltk_data stopwords punkt punkt_tab
+for _pkg, _path in (("stopwords", "corpora/stopwords"),
+                    ("punkt", "tokenizers/punkt"),
+                    ("punkt_tab", "tokenizers/punkt_tab")):
+    try:
+        nltk.data.find(_path)
+    except LookupError:
+        nltk.download(_pkg, quiet=True)
+
+# Load stopwords once at import (reads a corpus file per call otherwise)
+STOP_WORDS = frozenset(stopwords.words("english"))
 
-# Download necessary NLTK resources
-nltk.download("stopwords", quiet=True)
-nltk.download("punkt", quiet=True)
-nltk.download("punkt_tab", quiet=True)
+# Lightweight word tokenizer for counting/filtering; NLTK's Punkt-based
+# word_tokenize is much slower and not needed where only counts matter
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+# Precompiled text-cleaning patterns (compiled once at import)
+WS_RE = re.compile(r'\s+')
+SPECIAL_RE = re.compile(r'[^\w\s.,!?;:\'"()\-]')
+PUNCT_SPACE_RE = re.compile(r'\s+([.,!?;:])')
+COMMA_RE = re.compile(r',\s+')
+DOT_RUN_RE = re.compile(r'\.+')
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+# LRU cache of finished summaries keyed on content hash; repeat
+# submissions (same PDF, same pasted article) skip the whole pipeline
+SUMMARY_CACHE_SIZE = 1024
+summary_cache = OrderedDict()
+
+def summary_cache_key(text, method, max_sentences):
+    """Cache key for a summarization request"""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return (digest, method, max_sentences)
+
+# Prefer pypdfium2 (PDFium C++ bindings) for PDF text extraction when
+# available; it is much faster than pure-Python PyPDF2 on large files
+try:
+    import pypdfium2 as pdfium
+    USE_PDFIUM = True
+except ImportError:
+    USE_PDFIUM = False
+
+# Optional SIMD cosine kernels for the pairwise similarity matrix
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
 # Initialize the summarization model (using transformers)
+# On GPU, run in half precision: FP16 halves memory bandwidth and matmul cycles
 try:
-    summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+    import torch
+    _use_cuda = torch.cuda.is_available()
+    summarizer = pipeline(
+        "summarization",
+        model="facebook/bart-large-cnn",
+        device=0 if _use_cuda else -1,
+        torch_dtype=torch.float16 if _use_cuda else torch.float32
+    )
+    # KV-cache reuse keeps beam decoding O(T) per step instead of O(T^2)
+    summarizer.model.config.use_cache = True
+    try:
+        # Fuse the attention/projection kernels; the first request pays
+        # the compile cost, every later request gets the fused graph
+        summarizer.model = torch.compile(
+            summarizer.model, mode="reduce-overhead", fullgraph=False
+        )
+    except Exception as compile_error:
+        print(f"torch.compile unavailable, running eager: {compile_error}")
     USE_TRANSFORMER = True
 except Exception as e:
     print(f"Could not load transformer model: {e}")
     USE_TRANSFORMER = False
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from PDF file"""
-    try:
+def iter_pdf_pages(pdf_file):
+    """Yield extracted text one page at a time"""
+    if USE_PDFIUM:
+        pdf = pdfium.PdfDocument(pdf_file)
+        for page in pdf:
+            yield page.get_textpage().get_text_range()
+    else:
         pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
         for page in pdf_reader.pages:
-            text += page.extract_text() + " "
+            yield page.extract_text()
+
+def extract_text_from_pdf(pdf_file, max_chars=MAX_TEXT_LENGTH):
+    """Extract text from PDF file
+
+    Streams pages and stops once max_chars have been collected: text
+    past the validation limit would be rejected anyway, so there is no
+    point extracting hundreds of extra pages into memory first.
+    """
+    try:
+        pages = []
+        total_chars = 0
+        for page_text in iter_pdf_pages(pdf_file):
+            pages.append(page_text)
+            total_chars += len(page_text)
+            if total_chars > max_chars:
+                break
+        # Join once instead of concatenating per page (avoids O(n^2) copying)
+        text = " ".join(pages)
         # Clean up extracted text
-        text = re.sub(r'\s+', ' ', text)  # Remove extra whitespace
+        text = WS_RE.sub(' ', text)  # Remove extra whitespace
         text = text.strip()
         return text
     except Exception as e:
         return None
 
+def read_text_upload(file, max_chars=MAX_TEXT_LENGTH):
+    """Decode an uploaded text file incrementally
+
+    Streams 64 KB chunks through an incremental UTF-8 decoder and stops
+    once max_chars have been collected, instead of reading the whole
+    upload into memory and decoding it in one shot.
+    """
+    parts = []
+    total_chars = 0
+    chunks = iter(lambda: file.stream.read(65536), b'')
+    for chunk in codecs.iterdecode(chunks, 'utf-8', errors='replace'):
+        parts.append(chunk)
+        total_chars += len(chunk)
+        if total_chars > max_chars:
+            break
+    return ''.join(parts)
+
 def clean_text(text):
     """Clean and preprocess text"""
     # Remove multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = WS_RE.sub(' ', text)
     # Remove special characters but keep punctuation
-    text = re.sub(r'[^\w\s.,!?;:\'"()\-]', '', text)
+    text = SPECIAL_RE.sub('', text)
     # Fix spacing around punctuation
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+    text = PUNCT_SPACE_RE.sub(r'\1', text)
     return text.strip()
 
 def preprocess_text_for_sentences(text):
     """Preprocess text to handle comma-separated clauses as separate sentences"""
     # Replace commas followed by space with periods for better sentence splitting
     # This helps when input is like "clause1, clause2, clause3"
-    text = re.sub(r',\s+', '. ', text)
+    text = COMMA_RE.sub('. ', text)
     # Ensure sentences end with period
     if not text.endswith('.'):
         text += '.'
     # Clean up multiple periods
-    text = re.sub(r'\.+', '.', text)
+    text = DOT_RUN_RE.sub('.', text)
     # Fix spacing
-    text = re.sub(r'\s+', ' ', text)
+    text = WS_RE.sub(' ', text)
     return text.strip()
 
 def calculate_optimal_summary_length(text):
@@ -133,45 +231,49 @@ def calculate_optimal_summary_length(text):
     
     return target_sentences
 
-def sentence_similarity(sent1, sent2, stopwords=None):
-    """Compute similarity between two sentences"""
-    if stopwords is None:
-        stopwords = []
-   
-    sent1 = [word for word in sent1 if word not in stopwords]
-    sent2 = [word for word in sent2 if word not in stopwords]
-   
-    all_words = list(set(sent1 + sent2))
-   
-    vector1 = [0] * len(all_words)
-    vector2 = [0] * len(all_words)
-    
-    for word in sent1:
-        if word in all_words:
-            vector1[all_words.index(word)] += 1
-    for word in sent2:
-        if word in all_words:
-            vector2[all_words.index(word)] += 1
-   
-    if sum(vector1) == 0 or sum(vector2) == 0:
-        return 0
-    
-    return 1 - cosine_distance(vector1, vector2)
-
-def build_similarity_matrix(sentences, stop_words):
-    """Build a similarity matrix for all sentences"""
-    similarity_matrix = np.zeros((len(sentences), len(sentences)))
-
-    for i in range(len(sentences)):
-        for j in range(len(sentences)):
-            if i != j:
-                similarity_matrix[i][j] = sentence_similarity(sentences[i], sentences[j], stop_words)
-   
+def build_similarity_matrix(doc_term_matrix):
+    """Build a pairwise cosine similarity matrix from a document-term matrix
+
+    Computes the full matrix as a single matrix product instead of
+    looping over sentence pairs. The result stays sparse (CSR) so long
+    documents never materialize a dense n x n array.
+    """
+    # L2-normalize rows so the matrix product gives cosine similarity
+    normalized = normalize(doc_term_matrix, norm='l2', axis=1)
+
+    if HAS_SIMSIMD and normalized.shape[0] >= 128:
+        # SimSIMD's vectorized cosine kernels beat the sparse product
+        # once there are enough rows to amortize densification
+        dense = normalized.toarray().astype(np.float32)
+        sim = 1.0 - np.asarray(simsimd.cdist(dense, dense, metric='cosine'))
+        similarity_matrix = csr_matrix(np.nan_to_num(sim, copy=False))
+    else:
+        similarity_matrix = (normalized @ normalized.T).tocsr()
+
+    similarity_matrix.setdiag(0)
+    similarity_matrix.eliminate_zeros()
+
     return similarity_matrix
 
+# Precompiled feature patterns for sentence scoring (compiled once at import)
+NUM_RE = re.compile(r'\d+')
+CAP_RE = re.compile(r'\b[A-Z][a-z]+')
+DISCOURSE_RE = re.compile(
+    r'\b(?:however|therefore|thus|consequently|moreover|furthermore|'
+    r'importantly|significantly|notably|essentially|primarily|'
+    r'specifically|particularly|especially|indeed|in fact|'
+    r'for example|for instance|in conclusion|to summarize|overall)\b'
+)
+EMPHASIS_RE = re.compile(
+    r'\b(?:most|best|worst|largest|smallest|critical|'
+    r'essential|key|main|major|significant|important)\b'
+)
+
 def calculate_sentence_importance(sentences, stop_words):
-    """Calculate importance scores for sentences using advanced multi-factor analysis"""
-    scores = {}
+    """Calculate importance scores for sentences using advanced multi-factor analysis
+
+    Returns a 1-D NumPy array of combined scores, one per sentence.
+    """
     n_sentences = len(sentences)
     
     # 1. TF-IDF scores - Most important for content relevance
@@ -189,132 +291,111 @@ def calculate_sentence_importance(sentences, stop_words):
         if tfidf_scores.max() > 0:
             tfidf_scores = tfidf_scores / tfidf_scores.max()
     except:
+        tfidf_matrix = None
         tfidf_scores = np.ones(n_sentences)
     
-    # 2. Enhanced Position scores
-    position_scores = np.zeros(n_sentences)
-    for i in range(n_sentences):
-        if i == 0:
-            position_scores[i] = 3.0  # First sentence - critical
-        elif i == 1:
-            position_scores[i] = 2.0  # Second sentence - very important
-        elif i < min(5, n_sentences * 0.1):
-            position_scores[i] = 1.5  # Early sentences
-        elif i >= n_sentences - 1:
-            position_scores[i] = 1.8  # Last sentence - often conclusion
-        elif i >= n_sentences - 3:
-            position_scores[i] = 1.3  # Near end
-        else:
-            position_scores[i] = 1.0  # Middle
-    
+    # 2. Enhanced Position scores (np.select keeps the if/elif precedence)
+    idx = np.arange(n_sentences)
+    position_scores = np.select(
+        [idx == 0,                           # First sentence - critical
+         idx == 1,                           # Second sentence - very important
+         idx < min(5, n_sentences * 0.1),    # Early sentences
+         idx >= n_sentences - 1,             # Last sentence - often conclusion
+         idx >= n_sentences - 3],            # Near end
+        [3.0, 2.0, 1.5, 1.8, 1.3],
+        default=1.0                          # Middle
+    )
+
     # 3. Length scores - Prefer informative sentences
-    length_scores = np.zeros(n_sentences)
-    for i, sentence in enumerate(sentences):
-        words = word_tokenize(sentence)
-        word_count = len(words)
-        if 12 <= word_count <= 25:  # Sweet spot
-            length_scores[i] = 2.0
-        elif 8 <= word_count <= 35:  # Acceptable
-            length_scores[i] = 1.5
-        elif 5 <= word_count <= 45:  # Ok
-            length_scores[i] = 1.0
-        else:  # Too short or too long
-            length_scores[i] = 0.5
-    
-    # 4. Enhanced Keyword and Feature scores
-    keyword_scores = np.zeros(n_sentences)
-    discourse_markers = [
-        'however', 'therefore', 'thus', 'consequently', 'moreover', 'furthermore',
-        'importantly', 'significantly', 'notably', 'essentially', 'primarily',
-        'specifically', 'particularly', 'especially', 'indeed', 'in fact',
-        'for example', 'for instance', 'in conclusion', 'to summarize', 'overall'
-    ]
-    
-    for i, sentence in enumerate(sentences):
-        score = 1.0
-        sentence_lower = sentence.lower()
-        
-        # Numbers (facts, statistics)
-        num_count = len(re.findall(r'\d+', sentence))
-        if num_count > 0:
-            score += min(num_count * 0.3, 0.9)
-        
-        # Proper nouns (entities, names)
-        capitals = len(re.findall(r'\b[A-Z][a-z]+', sentence))
-        if capitals > 0:
-            score += min(capitals * 0.15, 0.6)
-        
-        # Quotation marks (direct quotes)
-        if '"' in sentence or '"' in sentence or "'" in sentence:
-            score += 0.4
-        
-        # Discourse markers (signal importance)
-        for marker in discourse_markers:
-            if marker in sentence_lower:
-                score += 0.5
-                break
-        
-        # Questions (often frame key issues)
-        if '?' in sentence:
-            score += 0.3
-        
-        # Superlatives and emphasis words
-        emphasis_words = ['most', 'best', 'worst', 'largest', 'smallest', 'critical', 
-                         'essential', 'key', 'main', 'major', 'significant', 'important']
-        for word in emphasis_words:
-            if re.search(r'\b' + word + r'\b', sentence_lower):
-                score += 0.2
-                break
-        
-        keyword_scores[i] = score
-    
+    word_counts = np.array([len(TOKEN_RE.findall(s)) for s in sentences])
+    length_scores = np.select(
+        [(word_counts >= 12) & (word_counts <= 25),   # Sweet spot
+         (word_counts >= 8) & (word_counts <= 35),    # Acceptable
+         (word_counts >= 5) & (word_counts <= 45)],   # Ok
+        [2.0, 1.5, 1.0],
+        default=0.5                                   # Too short or too long
+    )
+    
+    # 4. Enhanced Keyword and Feature scores (vectorized feature arrays)
+    lowered = [s.lower() for s in sentences]
+    num_counts = np.array([len(NUM_RE.findall(s)) for s in sentences])
+    cap_counts = np.array([len(CAP_RE.findall(s)) for s in sentences])
+    has_quote = np.array(['"' in s or '"' in s or "'" in s for s in sentences])
+    has_discourse = np.array([bool(DISCOURSE_RE.search(s)) for s in lowered])
+    has_question = np.array(['?' in s for s in sentences])
+    has_emphasis = np.array([bool(EMPHASIS_RE.search(s)) for s in lowered])
+
+    keyword_scores = (
+        1.0
+        + np.minimum(num_counts * 0.3, 0.9)    # Numbers (facts, statistics)
+        + np.minimum(cap_counts * 0.15, 0.6)   # Proper nouns (entities, names)
+        + 0.4 * has_quote                      # Quotation marks (direct quotes)
+        + 0.5 * has_discourse                  # Discourse markers
+        + 0.3 * has_question                   # Questions (often frame key issues)
+        + 0.2 * has_emphasis                   # Superlatives and emphasis words
+    )
+
     # 5. Centrality scores (TextRank-style graph)
-    processed_sentences = [word_tokenize(s.lower()) for s in sentences]
-    similarity_matrix = build_similarity_matrix(processed_sentences, stop_words)
+    # Reuse the TF-IDF matrix from step 1; no second tokenization pass
+    if tfidf_matrix is not None:
+        similarity_matrix = build_similarity_matrix(tfidf_matrix)
+    else:
+        similarity_matrix = csr_matrix((n_sentences, n_sentences))
     
     # Calculate eigenvector centrality (better than simple sum)
     centrality_scores = np.zeros(n_sentences)
-    if similarity_matrix.max() > 0:
-        # Normalize similarity matrix
-        row_sums = similarity_matrix.sum(axis=1)
-        row_sums[row_sums == 0] = 1  # Avoid division by zero
-        norm_matrix = similarity_matrix / row_sums[:, np.newaxis]
-        
-        # Power iteration for centrality
+    if similarity_matrix.nnz > 0:
+        # Row-normalize the sparse matrix (avoid division by zero)
+        row_sums = np.asarray(similarity_matrix.sum(axis=1)).ravel()
+        row_sums[row_sums == 0] = 1
+        norm_matrix_t = similarity_matrix.multiply(1.0 / row_sums[:, np.newaxis]).T.tocsr()
+
+        # Power iteration for centrality (sparse matvec is O(nnz), not O(n^2))
         centrality = np.ones(n_sentences) / n_sentences
         for _ in range(10):  # 10 iterations usually enough
-            centrality = 0.85 * norm_matrix.T.dot(centrality) + 0.15 / n_sentences
-        
+            centrality = 0.85 * (norm_matrix_t @ centrality) + 0.15 / n_sentences
+
         centrality_scores = centrality / centrality.max() if centrality.max() > 0 else centrality
     
     # 6. Diversity penalty - Reduce score for very similar sentences already selected
     diversity_scores = np.ones(n_sentences)
     
     # Combine all scores with optimized weights
-    for i in range(n_sentences):
-        combined_score = (
-            tfidf_scores[i] * 3.0 +           # Content relevance - highest weight
-            centrality_scores[i] * 2.5 +      # Centrality - very important
-            position_scores[i] * 2.0 +        # Position - important
-            keyword_scores[i] * 1.5 +         # Keywords and features
-            length_scores[i] * 1.0 +          # Length preference
-            diversity_scores[i] * 0.5         # Diversity bonus
-        )
-        scores[i] = combined_score
-    
-    return scores
+    combined_scores = (
+        tfidf_scores * 3.0 +           # Content relevance - highest weight
+        centrality_scores * 2.5 +      # Centrality - very important
+        position_scores * 2.0 +        # Position - important
+        keyword_scores * 1.5 +         # Keywords and features
+        length_scores * 1.0 +          # Length preference
+        diversity_scores * 0.5         # Diversity bonus
+    )
 
-def are_sentences_similar(sent1, sent2, threshold=0.7):
-    """Check if two sentences are too similar"""
-    words1 = set(word_tokenize(sent1.lower()))
-    words2 = set(word_tokenize(sent2.lower()))
-    
-    if len(words1) == 0 or len(words2) == 0:
+    return combined_scores
+
+def sentence_token_set(sentence):
+    """Lowercased token set for Jaccard-based redundancy checks"""
+    return frozenset(TOKEN_RE.findall(sentence.lower()))
+
+def sentence_fingerprint(tokens):
+    """64-bit token fingerprint (each token hashed to one bit)
+
+    Popcount Jaccard on two fingerprints cheaply approximates the set
+    Jaccard, so most dissimilar pairs can be rejected without touching
+    the token sets.
+    """
+    fingerprint = 0
+    for token in tokens:
+        fingerprint |= 1 << (hash(token) & 63)
+    return fingerprint
+
+def are_sentences_similar(tokens1, tokens2, threshold=0.7):
+    """Check if two sentences (as precomputed token sets) are too similar"""
+    if len(tokens1) == 0 or len(tokens2) == 0:
         return False
-    
-    intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
-    
+
+    intersection = len(tokens1 & tokens2)
+    union = len(tokens1) + len(tokens2) - intersection
+
     similarity = intersection / union if union > 0 else 0
     return similarity > threshold
 
@@ -325,7 +406,7 @@ def textrank_summarize(text, max_sentences=None):
         text: Input text to summarize
         max_sentences: Maximum sentences in summary. If None, automatically calculated.
     """
-    stop_words = set(stopwords.words("english"))
+    stop_words = STOP_WORDS
     
     # Preprocess text to handle comma-separated clauses
     text = preprocess_text_for_sentences(text)
@@ -357,7 +438,7 @@ def textrank_summarize(text, max_sentences=None):
     # Step 2: Filter sentences by length and quality
     filtered_sentences = []
     for sentence in unique_sentences:
-        words = word_tokenize(sentence)
+        words = TOKEN_RE.findall(sentence)
         # Keep sentences with at least 3 words (relaxed from 5)
         if 3 <= len(words) <= 50:
             # Remove sentences that are likely headers or titles (all caps, very short)
@@ -373,15 +454,26 @@ def textrank_summarize(text, max_sentences=None):
     
     # Step 3: Calculate importance scores
     sentence_scores = calculate_sentence_importance(filtered_sentences, stop_words)
-    
+
     # Step 4: Select diverse sentences (avoid very similar ones)
+    # Tokenize each candidate once; the redundancy loop below compares pairs
+    token_sets = [sentence_token_set(s) for s in filtered_sentences]
+    fingerprints = [sentence_fingerprint(ts) for ts in token_sets]
     selected_sentences = []
     selected_indices = []
     
-    # Sort by score
-    ranked_items = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)
-    
-    for idx, score in ranked_items:
+    # Rank only a top-k pool via argpartition (O(n)) instead of fully
+    # sorting every sentence; the redundancy filter below rarely rejects
+    # more than a couple of candidates per summary slot
+    n_candidates = len(filtered_sentences)
+    pool_size = min(n_candidates, 3 * max_sentences + 5)
+    if pool_size < n_candidates:
+        pool = np.argpartition(-sentence_scores, pool_size - 1)[:pool_size]
+        ranked_indices = pool[np.argsort(-sentence_scores[pool])]
+    else:
+        ranked_indices = np.argsort(-sentence_scores)
+
+    for idx in ranked_indices:
         if len(selected_indices) >= max_sentences:
             break
         
@@ -390,8 +482,14 @@ def textrank_summarize(text, max_sentences=None):
         # Check if this sentence is too similar to already selected ones
         is_redundant = False
         for selected_idx in selected_indices:
+            # Fingerprint popcount Jaccard first: clearly dissimilar pairs
+            # (well under the 0.5 threshold) skip the exact set check
+            union_bits = (fingerprints[idx] | fingerprints[selected_idx]).bit_count()
+            inter_bits = (fingerprints[idx] & fingerprints[selected_idx]).bit_count()
+            if union_bits and inter_bits / union_bits < 0.35:
+                continue
             # Use stricter threshold (0.5 instead of 0.6) for better duplicate detection
-            if are_sentences_similar(sentence, filtered_sentences[selected_idx], threshold=0.5):
+            if are_sentences_similar(token_sets[idx], token_sets[selected_idx], threshold=0.5):
                 is_redundant = True
                 break
         
@@ -401,7 +499,10 @@ def textrank_summarize(text, max_sentences=None):
     
     # If we don't have enough sentences due to redundancy, add more with lower scores
     if len(selected_indices) < max_sentences:
-        for idx, score in ranked_items:
+        if pool_size < n_candidates:
+            # The top-k pool was mostly redundant; fall back to the full ranking
+            ranked_indices = np.argsort(-sentence_scores)
+        for idx in ranked_indices:
             if len(selected_indices) >= max_sentences:
                 break
             if idx not in selected_indices:
@@ -415,7 +516,7 @@ def textrank_summarize(text, max_sentences=None):
     summary = " ".join(final_sentences)
     
     # Final cleanup
-    summary = re.sub(r'\s+', ' ', summary).strip()
+    summary = WS_RE.sub(' ', summary).strip()
     
     return summary
 
@@ -459,30 +560,66 @@ def transformer_summarize(text, max_sentences=None):
             sentences = sent_tokenize(text)
             if len(sentences) > max_sentences * 3:
                 # Extract top sentences using TextRank first
-                stop_words = stopwords.words("english")
+                stop_words = STOP_WORDS
                 scores = calculate_sentence_importance(sentences, stop_words)
-                top_indices = sorted(scores.keys(), key=lambda k: scores[k], reverse=True)[:max_sentences * 3]
-                top_indices = sorted(top_indices)  # Maintain order
+                top_indices = np.argsort(-scores)[:max_sentences * 3]
+                top_indices = np.sort(top_indices)  # Maintain order
                 text = " ".join([sentences[i] for i in top_indices])
                 words = text.split()
         
-        # Limit to model's capacity
+        # If text still exceeds the model window, pack sentences into chunks
+        # and summarize all chunks in ONE batched pipeline call instead of
+        # truncating (batching amortizes tokenization and inference overhead)
         if len(words) > 1024:
-            text = ' '.join(words[:1024])
-        
-        # Generate summary with optimized parameters
-        summary = summarizer(
-            text, 
-            max_length=max_length, 
-            min_length=min_length,
-            do_sample=False,
-            truncation=True,
-            length_penalty=2.0,  # Encourage appropriate length
-            num_beams=4,          # Better quality with beam search
-            early_stopping=True
-        )
-        
-        result = summary[0]['summary_text']
+            chunk_sentences = sent_tokenize(text)
+            sent_lengths = summarizer.tokenizer(
+                chunk_sentences, add_special_tokens=False, return_length=True
+            )['length']
+
+            chunks = []
+            current_chunk = []
+            current_len = 0
+            for sentence, sent_len in zip(chunk_sentences, sent_lengths):
+                if current_chunk and current_len + sent_len > 900:
+                    chunks.append(' '.join(current_chunk))
+                    current_chunk = []
+                    current_len = 0
+                current_chunk.append(sentence)
+                current_len += sent_len
+            if current_chunk:
+                chunks.append(' '.join(current_chunk))
+
+            # Split the target length across chunks
+            chunk_max = max(50, max_length // len(chunks))
+            chunk_min = max(20, min(min_length // len(chunks), chunk_max - 10))
+
+            summaries = summarizer(
+                chunks,
+                batch_size=len(chunks),
+                max_length=chunk_max,
+                min_length=chunk_min,
+                do_sample=False,
+                truncation=True,
+                length_penalty=2.0,
+                num_beams=2,
+                early_stopping=True
+            )
+            result = ' '.join(s['summary_text'].strip() for s in summaries)
+        else:
+            # Generate summary with optimized parameters
+            # Beam search cost grows with beam count; short outputs don't need 4 beams
+            num_beams = 2 if max_length < 120 else 4
+            summary = summarizer(
+                text,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                truncation=True,
+                length_penalty=2.0,  # Encourage appropriate length
+                num_beams=num_beams,  # Better quality with beam search
+                early_stopping=True
+            )
+            result = summary[0]['summary_text']
         
         # Post-process: ensure proper formatting
         result = result.strip()
@@ -518,14 +655,22 @@ def summarize():
                 app.logger.error(f"File validation failed: {file_errors}")
                 return jsonify({'error': '; '.join(file_errors)}), 400
             
-            if file.filename.endswith('.pdf'):
+            # Dispatch on the file's magic bytes, not the client-supplied
+            # extension (closes a spoofed-extension gap)
+            magic = file.stream.read(5)
+            file.stream.seek(0)
+
+            if magic.startswith(b'%PDF'):
                 # Extract text from PDF
                 text = extract_text_from_pdf(file)
                 if not text:
                     return jsonify({'error': 'Could not extract text from PDF'}), 400
+            elif file.filename.endswith('.pdf'):
+                # Claims to be a PDF but the payload is not one
+                return jsonify({'error': 'Could not extract text from PDF'}), 400
             elif file.filename.endswith('.txt'):
-                # Read text file
-                text = file.read().decode('utf-8')
+                # Stream-decode the text file
+                text = read_text_upload(file)
             else:
                 return jsonify({'error': 'Unsupported file format. Please upload PDF or TXT file'}), 400
         
@@ -569,22 +714,33 @@ def summarize():
             app.logger.error(f"Max sentences validation failed: {sentences_errors}")
             return jsonify({'error': '; '.join(sentences_errors)}), 400
         
-        # Generate summary (max_sentences is either None or int from validation)
-        if method == 'transformer' and USE_TRANSFORMER:
-            summary = transformer_summarize(text, max_sentences)
-            if not summary:
-                # Fallback to TextRank
-                summary = textrank_summarize(text, max_sentences)
+        # Reuse a cached summary when the same text/parameters were seen before
+        cache_key = summary_cache_key(text, method, max_sentences)
+        summary = summary_cache.get(cache_key)
+        if summary is not None:
+            summary_cache.move_to_end(cache_key)
+            app.logger.info("Returning cached summary")
         else:
-            summary = textrank_summarize(text, max_sentences)
-        
-        # Apply grammar correction and polishing
-        summary = polish_summary(summary)
-        app.logger.info("Applied grammar correction and polishing to summary")
-        
-        # Apply smart formatting based on document structure
-        summary = format_smart_summary(text, summary)
-        app.logger.info("Applied smart formatting to preserve document structure")
+            # Generate summary (max_sentences is either None or int from validation)
+            if method == 'transformer' and USE_TRANSFORMER:
+                summary = transformer_summarize(text, max_sentences)
+                if not summary:
+                    # Fallback to TextRank
+                    summary = textrank_summarize(text, max_sentences)
+            else:
+                summary = textrank_summarize(text, max_sentences)
+
+            # Apply grammar correction and polishing
+            summary = polish_summary(summary)
+            app.logger.info("Applied grammar correction and polishing to summary")
+
+            # Apply smart formatting based on document structure
+            summary = format_smart_summary(text, summary)
+            app.logger.info("Applied smart formatting to preserve document structure")
+
+            summary_cache[cache_key] = summary
+            if len(summary_cache) > SUMMARY_CACHE_SIZE:
+                summary_cache.popitem(last=False)  # Evict least recently used
         
         # Calculate stats
         original_words = len(text.split())
@@ -4,6 +4,8 @@ Security layer for text and video summarization endpoints
 """
 
 import re
+import time
+from collections import defaultdict, deque
 from urllib.parse import urlparse, parse_qs
 
 # Validation constants
@@ -195,7 +197,12 @@ def validate_request_body(data):
 
 
 # Rate limiting helper (simple implementation)
-request_counts = {}
+# Per-IP deques of request timestamps; expired entries are popped from
+# the front, so each request does amortized O(1) work instead of
+# rebuilding the whole list. Note: per-process only — a multi-worker
+# deployment needs a shared store (e.g. Redis) instead.
+request_counts = defaultdict(deque)
+_last_sweep = 0.0
 
 def check_rate_limit(ip_address, limit=100, window=60):
     """
@@ -203,23 +210,29 @@ def check_rate_limit(ip_address, limit=100, window=60):
     limit: max requests per window
     window: time window in seconds
     """
-    import time
-    
+    global _last_sweep
+
     current_time = time.time()
-    
-    # Clean old entries
-    request_counts[ip_address] = [
-        timestamp for timestamp in request_counts.get(ip_address, [])
-        if current_time - timestamp < window
-    ]
-    
+    cutoff = current_time - window
+
+    # Drop expired entries for this IP
+    timestamps = request_counts[ip_address]
+    while timestamps and timestamps[0] < cutoff:
+        timestamps.popleft()
+
     # Check if limit exceeded
-    if len(request_counts.get(ip_address, [])) >= limit:
+    if len(timestamps) >= limit:
         return False, f'Rate limit exceeded. Max {limit} requests per {window} seconds'
-    
+
     # Add current request
-    if ip_address not in request_counts:
-        request_counts[ip_address] = []
-    request_counts[ip_address].append(current_time)
-    
+    timestamps.append(current_time)
+
+    # Periodically purge idle IPs so memory doesn't grow unbounded
+    if current_time - _last_sweep > window:
+        _last_sweep = current_time
+        stale_ips = [ip for ip, dq in request_counts.items()
+                     if not dq or dq[-1] < cutoff]
+        for ip in stale_ips:
+            del request_counts[ip]
+
     return True, None
@@ -4,8 +4,22 @@ Improves grammar, punctuation, and readability of summaries
 """
 
 import re
+from functools import lru_cache
 from nltk.tokenize import sent_tokenize, word_tokenize
 
+
+@lru_cache(maxsize=1024)
+def _sent_tok(text):
+    """Cached sentence tokenization (the polishing pipeline re-splits
+    the same text several times; Punkt tokenization is not cheap)"""
+    return tuple(sent_tokenize(text))
+
+
+@lru_cache(maxsize=4096)
+def _word_tok(text):
+    """Cached word tokenization"""
+    return tuple(word_tokenize(text))
+
 # Common contractions and their expansions
 CONTRACTIONS = {
     "won't": "will not",
@@ -22,18 +36,77 @@ CONTRACTIONS = {
 # Articles that should precede certain words
 VOWEL_SOUNDS = ['a', 'e', 'i', 'o', 'u', 'h']
 
+# Precompiled patterns (compiled once at import instead of per call)
+_CONTRACTIONS_RE = re.compile(
+    r"\b(" + "|".join(re.escape(c) for c in CONTRACTIONS) + r")\b", re.IGNORECASE
+)
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,!?;:])')
+_PUNCT_NO_SPACE_RE = re.compile(r'([.,!?;:])([A-Za-z])')
+_ELLIPSIS_RE = re.compile(r'\.{2,}')
+_SPACE_APOSTROPHE_RE = re.compile(r"\s+'")
+_NUMBERS_ONLY_RE = re.compile(r'^[\d\s.,!?;:]+$')
+
+
+def _squash_ws(text):
+    """Collapse runs of whitespace to single spaces and strip the ends
+
+    str.split/join runs in C and is ~3x faster than the equivalent
+    regex substitution.
+    """
+    return ' '.join(text.split())
+
+# Simple stopword set used by the completeness check, built once at import
+_STOPWORDS_SIMPLE = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+_REDUNDANT_RE = re.compile(
+    r'\b(?:basically|essentially|actually|literally|in order to|'
+    r'due to the fact that|at this point in time|'
+    r'for all intents and purposes)\b',
+    re.IGNORECASE
+)
+_ENVELOPE_RE = re.compile(r'envelope\s*([a-z0-9])', re.IGNORECASE)
+_GMAIL_RE = re.compile(r'([a-z0-9])gmail\s*\.\s*com', re.IGNORECASE)
+_EMAIL_DOT_RE = re.compile(r'([a-z0-9])@([a-z]+)\s*\.\s*([a-z]+)', re.IGNORECASE)
+_PHONE_PAREN_RE = re.compile(r'phone\s*\(', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\s*([a-z0-9])', re.IGNORECASE)
+_LINKEDIN_RE = re.compile(r'linkedin\s*([a-z0-9])', re.IGNORECASE)
+_DOMAIN_ITEM_RE = re.compile(r'(\.com|\.in|\.org)\s+([A-Z][a-z]+:)')
+_PAREN_ITEM_RE = re.compile(r'(\))\s+([A-Z][a-z]+:)')
+_DIGITS_ITEM_RE = re.compile(r'(\d{3,})\s+([A-Z][a-z]+:)')
+_GRAMMAR_RE = re.compile(
+    r"\b(?:(?P<sv_is>he|she|it)\s+are"
+    r"|(?P<sv_are>they|we|you)\s+is"
+    r"|(?P<dont_not>don't\s+not)"
+    r"|(?P<cant_not>can't\s+not)"
+    r"|(?P<there_is_many>there\s+is\s+many)"
+    r"|(?P<there_are_a>there\s+are\s+a))\b",
+    re.IGNORECASE
+)
+
+def _grammar_repl(match):
+    """Dispatch a grammar-fix replacement based on the matched group"""
+    if match.group('sv_is'):
+        return match.group('sv_is') + ' is'
+    if match.group('sv_are'):
+        return match.group('sv_are') + ' are'
+    if match.group('dont_not'):
+        return "don't"
+    if match.group('cant_not'):
+        return 'can'
+    if match.group('there_is_many'):
+        return 'there are many'
+    return 'there is a'
+_REPEAT_END_PUNCT_RE = re.compile(r'([.!?]){2,}')
+
 
 def expand_contractions(text):
     """Expand contractions for better readability"""
-    for contraction, expansion in CONTRACTIONS.items():
-        text = re.sub(r'\b' + re.escape(contraction) + r'\b', expansion, text, flags=re.IGNORECASE)
-    return text
+    return _CONTRACTIONS_RE.sub(lambda m: CONTRACTIONS[m.group(1).lower()], text)
 
 
 def fix_capitalization(text):
     """Ensure proper capitalization"""
     # Capitalize first letter of each sentence
-    sentences = sent_tokenize(text)
+    sentences = _sent_tok(text)
     corrected_sentences = []
     
     for sentence in sentences:
@@ -48,41 +121,40 @@ def fix_capitalization(text):
 def fix_punctuation(text):
     """Fix common punctuation issues"""
     # Remove spaces before punctuation
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
     
     # Add space after punctuation if missing
-    text = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', text)
+    text = _PUNCT_NO_SPACE_RE.sub(r'\1 \2', text)
     
     # Fix multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = _squash_ws(text)
     
     # Ensure sentences end with punctuation
-    text = text.strip()
     if text and text[-1] not in '.!?':
         text += '.'
     
     # Fix ellipsis
-    text = re.sub(r'\.{2,}', '...', text)
+    text = _ELLIPSIS_RE.sub('...', text)
     
     # Remove space before apostrophe
-    text = re.sub(r"\s+'", "'", text)
+    text = _SPACE_APOSTROPHE_RE.sub("'", text)
     
     return text
 
 
 def fix_sentence_structure(text):
     """Improve sentence structure"""
-    sentences = sent_tokenize(text)
+    sentences = _sent_tok(text)
     improved_sentences = []
     
     for sentence in sentences:
         # Skip very short sentences (likely fragments)
-        words = word_tokenize(sentence)
+        words = _word_tok(sentence)
         if len(words) < 3:
             continue
         
         # Remove sentences that are just numbers or symbols
-        if re.match(r'^[\d\s.,!?;:]+$', sentence):
+        if _NUMBERS_ONLY_RE.match(sentence):
             continue
         
         # Ensure sentence starts with a capital letter
@@ -100,34 +172,22 @@ def fix_sentence_structure(text):
 
 def remove_redundant_phrases(text):
     """Remove redundant or filler phrases"""
-    # Common redundant phrases in summaries
-    redundant_patterns = [
-        r'\b(basically|essentially|actually|literally)\b',
-        r'\b(in order to)\b',
-        r'\b(due to the fact that)\b',
-        r'\b(at this point in time)\b',
-        r'\b(for all intents and purposes)\b',
-    ]
-    
-    for pattern in redundant_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    text = _REDUNDANT_RE.sub('', text)
     
     # Clean up extra spaces
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return _squash_ws(text)
 
 
 def improve_article_usage(text):
     """Add missing articles where appropriate (basic heuristic)"""
     # This is a simplified approach - for production, consider using spaCy or similar
-    sentences = sent_tokenize(text)
+    sentences = _sent_tok(text)
     improved_sentences = []
     
     for sentence in sentences:
         # Basic pattern: verb + singular noun without article
         # Example: "He is teacher" -> "He is a teacher"
-        words = word_tokenize(sentence)
+        words = _word_tok(sentence)
         
         # Simple heuristic improvements
         sentence_improved = sentence
@@ -140,96 +200,133 @@ def improve_article_usage(text):
 def fix_contact_info_formatting(text):
     """Fix messy contact information formatting"""
     # Fix email formatting
-    text = re.sub(r'envelope\s*([a-z0-9])', r'Email: \1', text, flags=re.IGNORECASE)
-    text = re.sub(r'([a-z0-9])gmail\s*\.\s*com', r'\1@gmail.com', text, flags=re.IGNORECASE)
-    text = re.sub(r'([a-z0-9])@([a-z]+)\s*\.\s*([a-z]+)', r'\1@\2.\3', text, flags=re.IGNORECASE)
+    text = _ENVELOPE_RE.sub(r'Email: \1', text)
+    text = _GMAIL_RE.sub(r'\1@gmail.com', text)
+    text = _EMAIL_DOT_RE.sub(r'\1@\2.\3', text)
     
     # Fix phone formatting
-    text = re.sub(r'phone\s*\(', r'Phone: (', text, flags=re.IGNORECASE)
+    text = _PHONE_PAREN_RE.sub(r'Phone: (', text)
     
     # Fix GitHub formatting
-    text = re.sub(r'github\s*([a-z0-9])', r'GitHub: \1', text, flags=re.IGNORECASE)
+    text = _GITHUB_RE.sub(r'GitHub: \1', text)
     
     # Fix LinkedIn formatting
-    text = re.sub(r'linkedin\s*([a-z0-9])', r'LinkedIn: \1', text, flags=re.IGNORECASE)
+    text = _LINKEDIN_RE.sub(r'LinkedIn: \1', text)
     
     # Add commas between contact items
     # Pattern: .com followed by word
-    text = re.sub(r'(\.com|\.in|\.org)\s+([A-Z][a-z]+:)', r'\1, \2', text)
+    text = _DOMAIN_ITEM_RE.sub(r'\1, \2', text)
     
     # Pattern: ) followed by word
-    text = re.sub(r'(\))\s+([A-Z][a-z]+:)', r'\1, \2', text)
+    text = _PAREN_ITEM_RE.sub(r'\1, \2', text)
     
     # Pattern: digits followed by word
-    text = re.sub(r'(\d{3,})\s+([A-Z][a-z]+:)', r'\1, \2', text)
+    text = _DIGITS_ITEM_RE.sub(r'\1, \2', text)
     
     return text
 
 
 def fix_common_grammar_mistakes(text):
     """Fix common grammar mistakes"""
-    # Subject-verb agreement patterns (basic)
-    text = re.sub(r'\b(he|she|it)\s+are\b', r'\1 is', text, flags=re.IGNORECASE)
-    text = re.sub(r'\b(they|we|you)\s+is\b', r'\1 are', text, flags=re.IGNORECASE)
-    
-    # Fix double negatives
-    text = re.sub(r"\bdon't\s+not\b", "don't", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bcan't\s+not\b", "can", text, flags=re.IGNORECASE)
-    
-    # Fix common word confusions
-    text = re.sub(r'\bthere\s+is\s+many\b', 'there are many', text, flags=re.IGNORECASE)
-    text = re.sub(r'\bthere\s+are\s+a\b', 'there is a', text, flags=re.IGNORECASE)
-    
-    return text
+    # Subject-verb agreement, double negatives and common word
+    # confusions in a single pass with a per-match dispatcher
+    return _GRAMMAR_RE.sub(_grammar_repl, text)
+
+
+# Fast-path detectors: a summary that trips none of these is already
+# well-formed and can skip the pipeline entirely
+_BAD_PUNCT_RE = re.compile(r"\s[.,!?;:]|[.,!?;:][A-Za-z]|\.{2,}|\s'")
+_NEEDS_CAP_RE = re.compile(r'(?:^|[.!?] )[a-z]')
+# Anything fix_contact_info_formatting would touch; case-insensitive
+# throughout so the guard can only over-trigger (falling back to the
+# full pipeline), never under-trigger
+_CONTACT_HINT_RE = re.compile(
+    r'envelope\s*[a-z0-9]'
+    r'|[a-z0-9]gmail\s*\.\s*com'
+    r'|[a-z0-9]@[a-z]+\s*\.\s*[a-z]+'
+    r'|phone\s*\('
+    r'|github\s*[a-z0-9]'
+    r'|linkedin\s*[a-z0-9]'
+    r'|(?:\.com|\.in|\.org)\s+[a-z]+:'
+    r'|\)\s+[a-z]+:'
+    r'|\d{3,}\s+[a-z]+:',
+    re.IGNORECASE
+)
+
+
+def _polish_sentence(sentence):
+    """Apply all per-sentence corrections in one pass
+
+    Returns the polished sentence, or None when the sentence is a
+    fragment that should be dropped from the summary.
+    """
+    sentence = sentence.strip()
+    if not sentence:
+        return None
+
+    # Skip fragments and sentences that are just numbers or symbols
+    if len(_word_tok(sentence)) < 3:
+        return None
+    if _NUMBERS_ONLY_RE.match(sentence):
+        return None
+
+    # Remove redundant phrases and fix common grammar mistakes
+    sentence = _REDUNDANT_RE.sub('', sentence)
+    sentence = _GRAMMAR_RE.sub(_grammar_repl, sentence)
+    sentence = _squash_ws(sentence)
+    if not sentence:
+        return None
+
+    # Capitalize first letter and ensure closing punctuation
+    sentence = sentence[0].upper() + sentence[1:] if len(sentence) > 1 else sentence.upper()
+    if sentence[-1] not in '.!?':
+        sentence += '.'
+
+    # Drop grammatically incomplete leftovers
+    if not validate_sentence_completeness(sentence):
+        return None
+
+    return sentence
 
 
 def clean_summary_text(text):
     """Main function to clean and improve summary text
-    
-    Applies all grammar corrections and improvements
+
+    Whole-text fixes that affect sentence splitting run first; after
+    that every sentence goes through _polish_sentence exactly once
+    instead of being re-tokenized by each correction stage.
     """
     if not text or not text.strip():
         return text
-    
-    # Step 1: Fix contact info formatting (for resumes)
+
+    # Fast path: if nothing needs fixing, a single whitespace squash is
+    # the whole job
+    if ('  ' not in text
+            and _REDUNDANT_RE.search(text) is None
+            and _CONTRACTIONS_RE.search(text) is None
+            and _GRAMMAR_RE.search(text) is None
+            and _BAD_PUNCT_RE.search(text) is None
+            and _NEEDS_CAP_RE.search(text) is None
+            and _CONTACT_HINT_RE.search(text) is None):
+        return text.strip()
+
+    # Whole-text passes (must happen before sentence splitting)
     text = fix_contact_info_formatting(text)
-    
-    # Step 2: Expand contractions for clarity
     text = expand_contractions(text)
-    
-    # Step 3: Fix punctuation
     text = fix_punctuation(text)
+
+    # Single per-sentence pass: structure, redundancy, grammar, capitalization
+    text = ' '.join(filter(None, (_polish_sentence(s) for s in _sent_tok(text))))
+
+    # Final cleanup
+    text = _REPEAT_END_PUNCT_RE.sub(r'\1', text)
     
-    # Step 4: Fix sentence structure
-    text = fix_sentence_structure(text)
-    
-    # Step 5: Fix capitalization
-    text = fix_capitalization(text)
-    
-    # Step 6: Remove redundant phrases
-    text = remove_redundant_phrases(text)
-    
-    # Step 7: Fix common grammar mistakes
-    text = fix_common_grammar_mistakes(text)
-    
-    # Step 8: Improve article usage (basic)
-    text = improve_article_usage(text)
-    
-    # Step 9: Final cleanup
-    text = fix_punctuation(text)  # Run again for final polish
-    
-    # Step 10: Remove multiple consecutive punctuation marks
-    text = re.sub(r'([.!?]){2,}', r'\1', text)
-    
-    # Step 11: Ensure consistent spacing
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
+    return _squash_ws(text)
 
 
 def validate_sentence_completeness(sentence):
     """Check if a sentence is grammatically complete (basic check)"""
-    words = word_tokenize(sentence.lower())
+    words = _word_tok(sentence.lower())
     
     # Very basic check - sentence should have at least a noun/pronoun and verb
     # This is simplified - for production use spaCy POS tagging
@@ -239,8 +336,7 @@ def validate_sentence_completeness(sentence):
         return False
     
     # Check if it has some content words (not just stopwords)
-    stopwords_simple = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-    content_words = [w for w in words if w not in stopwords_simple]
+    content_words = [w for w in words if w not in _STOPWORDS_SIMPLE]
     
     if len(content_words) < 2:
         return False
@@ -254,7 +350,7 @@ def validate_sentence_completeness(sentence):
 
 def filter_incomplete_sentences(text):
     """Remove incomplete or fragmented sentences"""
-    sentences = sent_tokenize(text)
+    sentences = _sent_tok(text)
     complete_sentences = []
     
     for sentence in sentences:
@@ -269,12 +365,10 @@ def polish_summary(text):
     
     This is the main function to call for grammar correction
     """
-    # Apply all corrections
+    # Apply all corrections (incomplete sentences are dropped in the
+    # per-sentence pass, so no separate filtering step is needed)
     text = clean_summary_text(text)
     
-    # Filter out incomplete sentences
-    text = filter_incomplete_sentences(text)
-    
     # Final polish
     text = text.strip()
     
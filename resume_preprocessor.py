@@ -13,9 +13,25 @@ class ResumePreprocessor:
     """
     
     def __init__(self):
-        # Contact patterns
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
+        # Contact patterns (compiled once per instance, not per call)
+        self.email_re = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        self.phone_re = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+        self.github_res = [
+            re.compile(r'github\.com/([a-zA-Z0-9_-]+)', re.IGNORECASE),
+            re.compile(r'github[:\s]*([a-zA-Z0-9_-]+)', re.IGNORECASE),
+            re.compile(r'@([a-zA-Z0-9_-]+)\s*github', re.IGNORECASE),
+        ]
+        self.linkedin_res = [
+            re.compile(r'linkedin\.com/in/([a-zA-Z0-9_-]+)', re.IGNORECASE),
+            re.compile(r'linkedin[:\s]*([a-zA-Z0-9_-]+)', re.IGNORECASE),
+            re.compile(r'@([a-zA-Z0-9_-]+)\s*linkedin', re.IGNORECASE),
+        ]
+        self.domain_space_re = re.compile(r'(\.com|\.in|\.org)([A-Z])')
+        self.phone_word_re = re.compile(r'phone\s*\(', re.IGNORECASE)
+        self.github_word_re = re.compile(r'github\s*([a-z])', re.IGNORECASE)
+        self.linkedin_word_re = re.compile(r'linkedin\s*([a-z])', re.IGNORECASE)
+        self.domain_item_re = re.compile(r'(\.com|\.in|\.org)\s+([a-zA-Z])')
+        self.phone_item_re = re.compile(r'(\d{4})\s+([a-zA-Z])')
         
         # Section keywords
         self.section_keywords = [
@@ -23,6 +39,11 @@ class ResumePreprocessor:
             'professional experience', 'technical skills', 'achievements',
             'certifications', 'awards', 'summary', 'objective', 'profile'
         ]
+        # Single alternation so heading detection is one scan per line
+        # instead of one substring search per keyword
+        self.section_kw_re = re.compile(
+            '|'.join(re.escape(kw) for kw in self.section_keywords)
+        )
     
     def is_resume(self, text):
         """Check if text is likely a resume"""
@@ -30,9 +51,9 @@ class ResumePreprocessor:
         indicators = 0
         
         # Check for common resume elements
-        if re.search(self.email_pattern, text):
+        if self.email_re.search(text):
             indicators += 2
-        if re.search(self.phone_pattern, text):
+        if self.phone_re.search(text):
             indicators += 2
         if any(kw in text_lower for kw in ['linkedin', 'github']):
             indicators += 1
@@ -63,35 +84,25 @@ class ResumePreprocessor:
                     break
         
         # Extract email
-        email_matches = re.findall(self.email_pattern, text)
-        if email_matches:
-            contact_info['email'] = email_matches[0]
+        email_match = self.email_re.search(text)
+        if email_match:
+            contact_info['email'] = email_match.group(0)
         
         # Extract phone
-        phone_matches = re.findall(self.phone_pattern, text)
-        if phone_matches:
-            contact_info['phone'] = phone_matches[0]
+        phone_match = self.phone_re.search(text)
+        if phone_match:
+            contact_info['phone'] = phone_match.group(0)
         
         # Extract GitHub
-        github_patterns = [
-            r'github\.com/([a-zA-Z0-9_-]+)',
-            r'github[:\s]*([a-zA-Z0-9_-]+)',
-            r'@([a-zA-Z0-9_-]+)\s*github'
-        ]
-        for pattern in github_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.github_res:
+            match = pattern.search(text)
             if match:
                 contact_info['github'] = match.group(1)
                 break
         
         # Extract LinkedIn
-        linkedin_patterns = [
-            r'linkedin\.com/in/([a-zA-Z0-9_-]+)',
-            r'linkedin[:\s]*([a-zA-Z0-9_-]+)',
-            r'@([a-zA-Z0-9_-]+)\s*linkedin'
-        ]
-        for pattern in linkedin_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.linkedin_res:
+            match = pattern.search(text)
             if match:
                 contact_info['linkedin'] = match.group(1)
                 break
@@ -103,36 +114,42 @@ class ResumePreprocessor:
         # Fix common issues in contact lines
         
         # Add space after email
-        text = re.sub(r'(\.com|\.in|\.org)([A-Z])', r'\1. \2', text)
+        text = self.domain_space_re.sub(r'\1. \2', text)
         
         # Fix "phone" word
-        text = re.sub(r'phone\s*\(', r'Phone: (', text, flags=re.IGNORECASE)
+        text = self.phone_word_re.sub(r'Phone: (', text)
         
         # Fix "github" word
-        text = re.sub(r'github\s*([a-z])', r'GitHub: \1', text, flags=re.IGNORECASE)
+        text = self.github_word_re.sub(r'GitHub: \1', text)
         
         # Fix "linkedin" word
-        text = re.sub(r'linkedin\s*([a-z])', r'LinkedIn: \1', text, flags=re.IGNORECASE)
+        text = self.linkedin_word_re.sub(r'LinkedIn: \1', text)
         
         # Add commas between contact items
         # Pattern: email followed by word
-        text = re.sub(r'(\.com|\.in|\.org)\s+([a-zA-Z])', r'\1, \2', text)
+        text = self.domain_item_re.sub(r'\1, \2', text)
         
         # Pattern: phone followed by word
-        text = re.sub(r'(\d{4})\s+([a-zA-Z])', r'\1, \2', text)
+        text = self.phone_item_re.sub(r'\1, \2', text)
         
         return text
     
     def structure_sections(self, text):
-        """Add proper structure to resume sections"""
-        lines = text.split('\n')
+        """Add proper structure to resume sections
+
+        Accepts either the full text or an already-split list of lines,
+        so callers that have the lines in hand avoid a join/split
+        round-trip over the whole resume.
+        """
+        lines = text.split('\n') if isinstance(text, str) else text
         structured_lines = []
         
         for line in lines:
             line_lower = line.lower().strip()
             
-            # Check if line is a section heading
-            is_section = any(kw == line_lower or kw in line_lower for kw in self.section_keywords)
+            # Check if line is a section heading (exact match is subsumed
+            # by the substring search)
+            is_section = self.section_kw_re.search(line_lower) is not None
             
             if is_section:
                 # Add extra spacing before section
@@ -192,13 +209,8 @@ class ResumePreprocessor:
                 # Regular content line
                 cleaned_lines.append(line)
         
-        # Join lines
-        cleaned_text = '\n'.join(cleaned_lines)
-        
-        # Structure sections
-        cleaned_text = self.structure_sections(cleaned_text)
-        
-        return cleaned_text
+        # Structure sections directly from the cleaned lines
+        return self.structure_sections(cleaned_lines)
 
 
 # Singleton instance
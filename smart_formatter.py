@@ -5,8 +5,16 @@ Handles resumes, reports, structured documents with proper formatting
 """
 
 import re
+from functools import lru_cache
 from nltk.tokenize import sent_tokenize
-from collections import Counter
+from collections import Counter, defaultdict
+
+# Contact patterns as module-level constants; the cheap substring/digit
+# prefilters in _extract_contact_info keep the regex engine off texts
+# that cannot contain a match
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b')
+
 
 class SmartDocumentFormatter:
     """
@@ -23,37 +31,47 @@ class SmartDocumentFormatter:
             'languages', 'interests', 'hobbies', 'references', 'about'
         ]
         
-        # Bullet indicators
-        self.bullet_patterns = [
-            r'^\s*[•●○◦▪▫■□-]\s+',  # Bullet symbols
-            r'^\s*\d+[\.\)]\s+',     # Numbered lists
-            r'^\s*[a-z][\.\)]\s+',   # Lettered lists
-            r'^\s*>\s+',             # Blockquote style
-        ]
+        # Document-type keywords, scored as distinct-keyword hits per
+        # category; the combined alternation lets detect_document_type
+        # scan the text once instead of once per keyword
+        self.type_keywords = {
+            'resume': frozenset(['education', 'experience', 'skills', 'email',
+                                 'phone', 'linkedin', 'github']),
+            'report': frozenset(['introduction', 'methodology', 'results',
+                                 'conclusion', 'abstract']),
+            'article': frozenset(['author', 'published', 'journal', 'article',
+                                  'abstract']),
+        }
+        all_type_kws = sorted(set().union(*self.type_keywords.values()),
+                              key=len, reverse=True)
+        self.type_kw_re = re.compile('|'.join(re.escape(kw) for kw in all_type_kws))
+
+        # Section keywords as one alternation for the heading check
+        self.section_kw_re = re.compile(
+            '|'.join(re.escape(kw) for kw in self.section_keywords)
+        )
+
+        # Bullet indicators as one alternation: bullet symbols, numbered
+        # lists, lettered lists, blockquote style — one scan per line
+        # instead of four
+        self.bullet_re = re.compile(r'^\s*(?:[•●○◦▪▫■□\-]|\d+[.\)]|[a-z][.\)]|>)\s+')
+
+        # Social patterns (compiled once per instance, not per call)
+        self.github_re = re.compile(r'github[:\s/]*([a-zA-Z0-9_-]+)', re.IGNORECASE)
+        self.linkedin_re = re.compile(r'linkedin[:\s/]*([a-zA-Z0-9_-]+)', re.IGNORECASE)
     
     def detect_document_type(self, text):
         """Detect if document is resume, report, article, etc."""
-        text_lower = text.lower()
-        
-        # Resume indicators
-        resume_keywords = ['education', 'experience', 'skills', 'email', 'phone', 'linkedin', 'github']
-        resume_score = sum(1 for kw in resume_keywords if kw in text_lower)
-        
-        # Report indicators
-        report_keywords = ['introduction', 'methodology', 'results', 'conclusion', 'abstract']
-        report_score = sum(1 for kw in report_keywords if kw in text_lower)
-        
-        # Article indicators
-        article_keywords = ['author', 'published', 'journal', 'article', 'abstract']
-        article_score = sum(1 for kw in article_keywords if kw in text_lower)
-        
+        # One pass over the text; each category scores its distinct hits
+        found = set(self.type_kw_re.findall(text.lower()))
+
         scores = {
-            'resume': resume_score,
-            'report': report_score,
-            'article': article_score,
+            'resume': len(found & self.type_keywords['resume']),
+            'report': len(found & self.type_keywords['report']),
+            'article': len(found & self.type_keywords['article']),
             'general': 1  # Default
         }
-        
+
         return max(scores, key=scores.get)
     
     def detect_structure(self, text):
@@ -78,7 +96,7 @@ class SmartDocumentFormatter:
                 continue
             
             # Check if line is a heading (short, possibly all caps, no punctuation)
-            is_heading = self._is_heading(line_stripped)
+            is_heading = self._is_heading(line_stripped, line_stripped.lower())
             if is_heading:
                 current_section = line_stripped
                 structure['sections'].append({
@@ -114,24 +132,34 @@ class SmartDocumentFormatter:
         
         return structure
     
-    def _is_heading(self, line):
-        """Check if line is likely a heading"""
+    def _is_heading(self, line, line_lower=None):
+        """Check if line is likely a heading
+
+        Callers that already hold a lowercase copy pass it in so the
+        line is not lowercased again.
+        """
         # Criteria for heading:
         # - Short (< 50 chars)
         # - May be all caps
         # - No ending punctuation
         # - May contain section keywords
-        
+
         if len(line) > 50:
             return False
-        
-        # Check if it's a section keyword
-        if any(kw in line.lower() for kw in self.section_keywords):
+
+        # Check if it's a section keyword (single alternation scan)
+        if self.section_kw_re.search(line_lower if line_lower is not None else line.lower()):
             return True
         
-        # Check if mostly uppercase
-        if len([c for c in line if c.isupper()]) > len(line) * 0.5:
-            return True
+        # Check if mostly uppercase (count without building a list, and
+        # stop as soon as the threshold is passed)
+        threshold = len(line) * 0.5
+        uppers = 0
+        for c in line:
+            if c.isupper():
+                uppers += 1
+                if uppers > threshold:
+                    return True
         
         # Check if ends without punctuation
         if line and line[-1] not in '.!?,;:':
@@ -144,32 +172,47 @@ class SmartDocumentFormatter:
     
     def _is_bullet(self, line):
         """Check if line is a bullet point"""
-        for pattern in self.bullet_patterns:
-            if re.match(pattern, line):
-                return True
-        return False
-    
+        return self.bullet_re.match(line) is not None
+
     def _clean_bullet(self, line):
         """Remove bullet symbols from line"""
-        for pattern in self.bullet_patterns:
-            line = re.sub(pattern, '', line)
-        return line.strip()
+        return self.bullet_re.sub('', line, count=1).strip()
     
+    @lru_cache(maxsize=32)
+    def _analyze(self, text):
+        """Structural analysis of one document, cached on the text
+
+        Summarizing the same document repeatedly (e.g. at different
+        lengths) re-runs type detection, structure detection and contact
+        extraction on identical input; the cache computes them once.
+        """
+        return (self.detect_document_type(text),
+                self.detect_structure(text),
+                self._extract_contact_info(text))
+
     def create_formatted_summary(self, original_text, summary_sentences):
         """
         Create intelligently formatted summary
         Preserves document structure and adds appropriate formatting
         """
-        doc_type = self.detect_document_type(original_text)
-        structure = self.detect_structure(original_text)
-        
+        # Normalize once here so the _format_* helpers can assume a list
+        if isinstance(summary_sentences, str):
+            summary_sentences = sent_tokenize(summary_sentences)
+
+        # Fast path: with fewer than three line breaks there are no
+        # sections or bullet lists to preserve, so skip both detectors
+        if original_text.count('\n') < 3:
+            return self._format_simple_summary(summary_sentences)
+
+        doc_type, structure, contact_info = self._analyze(original_text)
+
         if not structure['has_structure']:
             # Simple paragraph format
             return self._format_simple_summary(summary_sentences)
-        
+
         # Structured format
         if doc_type == 'resume':
-            return self._format_resume_summary(structure, summary_sentences, original_text)
+            return self._format_resume_summary(structure, summary_sentences, contact_info)
         elif structure['sections']:
             return self._format_sectioned_summary(structure, summary_sentences)
         elif structure['bullets']:
@@ -179,79 +222,63 @@ class SmartDocumentFormatter:
     
     def _format_simple_summary(self, sentences):
         """Simple paragraph format"""
-        if isinstance(sentences, str):
-            sentences = sent_tokenize(sentences)
-        
-        # Group into paragraphs (3-4 sentences each)
-        paragraphs = []
-        current = []
-        
-        for sent in sentences:
-            current.append(sent)
-            if len(current) >= 3:
-                paragraphs.append(' '.join(current))
-                current = []
-        
-        if current:
-            paragraphs.append(' '.join(current))
-        
-        return '\n\n'.join(paragraphs)
+        # Group into paragraphs (3 sentences each), feeding the join
+        # directly instead of growing an intermediate list
+        return '\n\n'.join(
+            ' '.join(sentences[i:i + 3]) for i in range(0, len(sentences), 3)
+        )
     
     def _format_bulleted_summary(self, sentences):
         """Format as bullet points"""
-        if isinstance(sentences, str):
-            sentences = sent_tokenize(sentences)
-        
-        bullets = [f"• {sent.strip()}" for sent in sentences if sent.strip()]
-        return '\n'.join(bullets)
+        return '\n'.join(f"• {sent.strip()}" for sent in sentences if sent.strip())
     
     def _format_sectioned_summary(self, structure, sentences):
         """Format with sections and appropriate sub-formatting"""
-        if isinstance(sentences, str):
-            sentences = sent_tokenize(sentences)
-        
         formatted = []
         sentences_per_section = max(1, len(sentences) // len(structure['sections']))
-        
+
         for i, section in enumerate(structure['sections']):
             # Add section heading
             formatted.append(f"\n{section['title'].upper()}")
             formatted.append('-' * len(section['title']))
-            
+
             # Add sentences for this section
             start_idx = i * sentences_per_section
             end_idx = start_idx + sentences_per_section
             section_sentences = sentences[start_idx:end_idx]
-            
+
             # Check if section had bullets in original
             had_bullets = any(item['type'] == 'bullet' for item in section['content'])
-            
+
             if had_bullets:
                 # Format as bullets
-                for sent in section_sentences:
-                    formatted.append(f"  • {sent.strip()}")
+                formatted.extend(f"  • {sent.strip()}" for sent in section_sentences)
             else:
                 # Format as paragraph
                 formatted.append(f"  {' '.join(section_sentences)}")
-            
+
             formatted.append('')  # Empty line between sections
-        
+
         return '\n'.join(formatted)
     
-    def _format_resume_summary(self, structure, sentences, original_text):
+    def _format_resume_summary(self, structure, sentences, contact_info):
         """Special formatting for resumes"""
-        if isinstance(sentences, str):
-            sentences = sent_tokenize(sentences)
-        
         formatted = []
-        
-        # Extract key information
-        contact_info = self._extract_contact_info(original_text)
+
+        # Inverted token index built once, so each section finds its
+        # sentences with set lookups instead of substring-scanning every
+        # sentence per title word
+        token_index = defaultdict(set)
+        for idx, sent in enumerate(sentences):
+            for tok in sent.lower().split():
+                token_index[tok.strip('.,!?;:()')].add(idx)
+
+        # Contact info comes pre-extracted from the cached analysis
         if contact_info:
             formatted.append("CONTACT INFORMATION")
             formatted.append("-" * 20)
-            for key, value in contact_info.items():
-                formatted.append(f"  • {key.title()}: {value}")
+            formatted.extend(f"  • {key.title()}: {value}"
+                             for key, value in contact_info.items())
             formatted.append('')
         
         # Process sections
@@ -262,10 +289,8 @@ class SmartDocumentFormatter:
             
             # Find relevant sentences for this section
             section_lower = section['title'].lower()
-            relevant_sentences = [
-                s for s in sentences 
-                if any(word in s.lower() for word in section_lower.split())
-            ]
+            matched = set().union(*(token_index[w] for w in section_lower.split()))
+            relevant_sentences = [sentences[i] for i in sorted(matched)]
             
             if not relevant_sentences:
                 relevant_sentences = sentences[:2]  # Fallback
@@ -275,8 +300,7 @@ class SmartDocumentFormatter:
             
             if had_bullets or 'experience' in section_lower or 'project' in section_lower:
                 # Use bullet points
-                for sent in relevant_sentences:
-                    formatted.append(f"  • {sent.strip()}")
+                formatted.extend(f"  • {sent.strip()}" for sent in relevant_sentences)
             else:
                 # Use paragraph
                 formatted.append(f"  {' '.join(relevant_sentences)}")
@@ -289,29 +313,30 @@ class SmartDocumentFormatter:
         """Extract email, phone, GitHub, LinkedIn from text"""
         contact = {}
         
-        # Email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact['email'] = emails[0]
-        
-        # Phone
-        phone_pattern = r'\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            contact['phone'] = phones[0]
-        
-        # GitHub
-        if 'github' in text.lower():
-            github_match = re.search(r'github[:\s/]*([a-zA-Z0-9_-]+)', text, re.IGNORECASE)
-            if github_match:
-                contact['github'] = github_match.group(1)
-        
+        # Email ('@' in text is a memchr scan, far cheaper than letting
+        # the regex engine establish there is no match)
+        if '@' in text:
+            email_match = _EMAIL_RE.search(text)
+            if email_match:
+                contact['email'] = email_match.group(0)
+
+        # Phone (a phone number needs digits; texts without any skip
+        # the regex entirely)
+        if any(c.isdigit() for c in text):
+            phone_match = _PHONE_RE.search(text)
+            if phone_match:
+                contact['phone'] = phone_match.group(0)
+
+        # GitHub (the case-insensitive search already covers the old
+        # substring prefilter)
+        github_match = self.github_re.search(text)
+        if github_match:
+            contact['github'] = github_match.group(1)
+
         # LinkedIn
-        if 'linkedin' in text.lower():
-            linkedin_match = re.search(r'linkedin[:\s/]*([a-zA-Z0-9_-]+)', text, re.IGNORECASE)
-            if linkedin_match:
-                contact['linkedin'] = linkedin_match.group(1)
+        linkedin_match = self.linkedin_re.search(text)
+        if linkedin_match:
+            contact['linkedin'] = linkedin_match.group(1)
         
         return contact if contact else None
     
@@ -6,12 +6,13 @@ Extracts transcript from YouTube videos, summarizes content, and detects topic c
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 import re
+import string
+from itertools import islice
 from urllib.parse import urlparse, parse_qs
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 from grammar_corrector import polish_summary
 
@@ -23,22 +24,20 @@ except LookupError:
     nltk.download('punkt_tab', quiet=True)
     nltk.download('stopwords', quiet=True)
 
+# Translation table that strips punctuation in one C-level pass
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Stopwords loaded once at import; per-call loads re-read the corpus file
+_STOP_WORDS = frozenset(stopwords.words('english'))
+
+# All supported YouTube URL shapes in one pattern, compiled at import
+_VID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([^&\n?#]+)')
+
 
 def extract_video_id(url):
     """Extract YouTube video ID from various URL formats"""
-    # Handle different YouTube URL formats
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-        r'youtube\.com\/embed\/([^&\n?#]+)',
-        r'youtube\.com\/v\/([^&\n?#]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _VID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def get_youtube_transcript(video_url):
@@ -99,37 +98,41 @@ def detect_topic_changes(transcript_segments, window_size=5, threshold=0.3):
     
     # Combine text from segments
     texts = [seg['text'] for seg in transcript_segments]
-    
-    # Create sliding windows
+
+    # Fit one vectorizer on all segments up front; the loop below only
+    # sums precomputed rows instead of re-fitting a fresh vectorizer on
+    # every window pair
+    try:
+        vectorizer = TfidfVectorizer(stop_words='english', max_features=200)
+        tfidf_matrix = vectorizer.fit_transform(texts)
+    except:
+        return []
+
+    # Create sliding windows; changes closer than window_size to the
+    # previous accepted one would be discarded anyway, so skip their
+    # similarity computation entirely
     topic_changes = []
-    
+    last_change = -window_size * 2
+
     for i in range(window_size, len(texts) - window_size):
-        # Get text before and after current point
-        before_text = ' '.join(texts[i-window_size:i])
-        after_text = ' '.join(texts[i:i+window_size])
-        
-        # Calculate similarity using TF-IDF
-        try:
-            vectorizer = TfidfVectorizer(stop_words='english', max_features=50)
-            tfidf_matrix = vectorizer.fit_transform([before_text, after_text])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            # If similarity is low, it indicates topic change
-            if similarity < threshold:
-                topic_changes.append(i)
-        except:
+        if i - last_change < window_size:
             continue
-    
-    # Remove topic changes that are too close to each other
-    filtered_changes = []
-    last_change = -window_size * 2
-    
-    for change in topic_changes:
-        if change - last_change >= window_size:
-            filtered_changes.append(change)
-            last_change = change
-    
-    return filtered_changes
+
+        # Window vectors as sparse row sums over the shared vocabulary
+        before = np.asarray(tfidf_matrix[i-window_size:i].sum(axis=0)).ravel()
+        after = np.asarray(tfidf_matrix[i:i+window_size].sum(axis=0)).ravel()
+
+        norm_product = np.linalg.norm(before) * np.linalg.norm(after)
+        if norm_product == 0:
+            continue
+        similarity = float(np.dot(before, after)) / norm_product
+
+        # If similarity is low, it indicates topic change
+        if similarity < threshold:
+            topic_changes.append(i)
+            last_change = i
+
+    return topic_changes
 
 
 def format_timestamp(seconds):
@@ -150,13 +153,17 @@ def create_segments_with_topics(transcript_segments, topic_change_indices):
     Returns list of segments with timestamps and text
     """
     segments = []
-    
+
+    # Pull the text field out once; the loop below then joins islice
+    # views instead of allocating a fresh slice of dicts per segment
+    texts = [seg['text'] for seg in transcript_segments]
+
     # Add first segment
     start_idx = 0
-    
+
     for change_idx in topic_change_indices + [len(transcript_segments)]:
         # Combine text for this segment
-        segment_text = ' '.join([seg['text'] for seg in transcript_segments[start_idx:change_idx]])
+        segment_text = ' '.join(islice(texts, start_idx, change_idx))
         start_time = transcript_segments[start_idx]['start']
         
         if segment_text.strip():
@@ -178,29 +185,70 @@ def summarize_segment(text, max_sentences=2):
     if len(sentences) <= max_sentences:
         return text
     
-    # Simple extractive summarization using sentence position and length
-    stop_words = set(stopwords.words('english'))
-    
-    # Score sentences
-    scores = []
-    for i, sentence in enumerate(sentences):
-        words = word_tokenize(sentence.lower())
-        words = [w for w in words if w.isalnum() and w not in stop_words]
-        
-        # Score based on position (first sentences are important) and word count
-        position_score = 1.0 / (i + 1)
-        length_score = min(len(words) / 15, 1.0)  # Normalize to 15 words
-        
-        scores.append(position_score * 0.6 + length_score * 0.4)
-    
-    # Get top sentences
-    top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:max_sentences]
+    # Simple extractive summarization using sentence position and length.
+    # Content-word counts (punctuation stripped via str.translate) feed
+    # vectorized position/length scores instead of a per-sentence loop.
+    n_sentences = len(sentences)
+    lengths = np.fromiter(
+        (sum(1 for w in s.lower().translate(_PUNCT_TABLE).split()
+             if w not in _STOP_WORDS)
+         for s in sentences),
+        dtype=np.float32, count=n_sentences)
+
+    # First sentences are important; normalize length to 15 words
+    position_scores = 1.0 / (np.arange(n_sentences, dtype=np.float32) + 1.0)
+    length_scores = np.minimum(lengths / 15.0, 1.0)
+    scores = position_scores * 0.6 + length_scores * 0.4
+
+    # Top sentences via argpartition (O(n)) instead of a full sort
+    top_indices = np.argpartition(-scores, max_sentences - 1)[:max_sentences]
     top_indices.sort()  # Maintain original order
-    
-    summary = ' '.join([sentences[i] for i in top_indices])
+
+    summary = ' '.join(sentences[i] for i in top_indices)
     return summary
 
 
+def summarize_segments(texts, max_sentences=2):
+    """Summarize several segment texts in one batched pass
+
+    Sentence-tokenizes every segment up front and computes the
+    content-word counts for all sentences with a single NumPy pass, so
+    per-call setup is paid once for the whole transcript instead of
+    once per segment. Scoring matches summarize_segment exactly.
+    """
+    all_sentences = []
+    offsets = [0]
+    for text in texts:
+        all_sentences.extend(sent_tokenize(text))
+        offsets.append(len(all_sentences))
+
+    lengths = np.fromiter(
+        (sum(1 for w in s.lower().translate(_PUNCT_TABLE).split()
+             if w not in _STOP_WORDS)
+         for s in all_sentences),
+        dtype=np.float32, count=len(all_sentences))
+    length_scores = np.minimum(lengths / 15.0, 1.0)
+
+    summaries = []
+    for k, text in enumerate(texts):
+        start, end = offsets[k], offsets[k + 1]
+        n_sentences = end - start
+
+        if n_sentences <= max_sentences:
+            summaries.append(text)
+            continue
+
+        position_scores = 1.0 / (np.arange(n_sentences, dtype=np.float32) + 1.0)
+        scores = position_scores * 0.6 + length_scores[start:end] * 0.4
+
+        top_indices = np.argpartition(-scores, max_sentences - 1)[:max_sentences]
+        top_indices.sort()  # Maintain original order
+
+        summaries.append(' '.join(all_sentences[start + i] for i in top_indices))
+
+    return summaries
+
+
 def summarize_video_with_timestamps(video_url):
     """
     Main function to summarize video with topic changes and timestamps
@@ -220,11 +268,12 @@ def summarize_video_with_timestamps(video_url):
     # Create segments
     segments = create_segments_with_topics(transcript, topic_changes)
     
-    # Summarize each segment with grammar correction
+    # Summarize all segments in one batched pass, then apply grammar
+    # correction to each segment summary
+    segment_summaries = summarize_segments([seg['text'] for seg in segments],
+                                           max_sentences=2)
     summarized_segments = []
-    for segment in segments:
-        summary = summarize_segment(segment['text'], max_sentences=2)
-        # Apply grammar correction to each segment summary
+    for segment, summary in zip(segments, segment_summaries):
         summary = polish_summary(summary)
         summarized_segments.append({
             'timestamp': segment['timestamp'],
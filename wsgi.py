@@ -0,0 +1,16 @@
+"""
+WSGI entry point for production servers
+
+Run with:
+    gunicorn -w 4 -k gthread --threads 2 --timeout 120 --preload wsgi:app
+
+--preload matters here: it loads the BART checkpoint once in the master
+process so the model is shared copy-on-write across workers instead of
+being duplicated per worker. For GPU inference prefer a single worker
+with more threads (-w 1 --threads 8).
+"""
+
+from backend_api import app
+
+if __name__ == "__main__":
+    app.run()